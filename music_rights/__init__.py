@@ -0,0 +1,8 @@
+"""Music Rights Analysis Tool
+
+Matches Spotify catalogues against the unclaimed musical work right shares
+dataset. Importing the package is cheap: pandas, requests and openpyxl are
+only loaded by the functions that need them.
+"""
+
+__version__ = "1.0.0"
@@ -0,0 +1,196 @@
+"""End-to-end analysis flows behind the CLI subcommands"""
+
+from music_rights.dataset import load_dataset_correctly, load_unclaimed_isrcs
+from music_rights.matching import find_matches, summarize_resolved_isrcs
+from music_rights.report import create_final_report, create_reverse_report
+from music_rights.spotify import (get_artist_discography, load_isrc_cache, resolve_isrcs,
+                                  search_artist, test_spotify_auth)
+
+FALLBACK_ARTISTS = [
+    "Taylor Swift",
+    "Ed Sheeran",
+    "Adele",
+    "Drake",
+    "Beyonce",
+    "Coldplay",
+    "Eminem",
+    "Kanye West",
+    "Rihanna",
+    "Bruno Mars"
+]
+
+
+def analyze_artist(token, isrc_lookup, artist_name):
+    """Match one artist's top tracks against the unclaimed works
+
+    Returns (artist, catalog, matches); catalog and matches are None when
+    the artist or their tracks could not be found.
+    """
+    artist = search_artist(token, artist_name)
+    if not artist:
+        print(f"❌ Cannot find {artist_name}")
+        return None, None, None
+
+    artist_catalog = get_artist_discography(token, artist['id'], artist['name'])
+    if artist_catalog.empty:
+        print(f"❌ No tracks found for {artist['name']}")
+        return artist, None, None
+
+    return artist, artist_catalog, find_matches(artist_catalog, isrc_lookup)
+
+
+def try_multiple_artists(token, isrc_lookup, artists_to_try=None, max_artists=3, dataset=None):
+    """Try multiple artists to find matches"""
+    print(f"\n🔄 Step 5: Trying multiple artists to find matches...")
+
+    all_matches = []
+    for artist_name in (artists_to_try or FALLBACK_ARTISTS)[:max_artists]:
+        print(f"\n🎯 Testing: {artist_name}")
+
+        artist, catalog, matches = analyze_artist(token, isrc_lookup, artist_name)
+        if matches is not None and not matches.empty:
+            print(f"🎉 FOUND MATCHES for {artist_name}!")
+            all_matches.append({
+                'artist': artist_name,
+                'catalog': catalog,
+                'matches': matches
+            })
+            # Create individual report for this artist
+            create_final_report(catalog, matches, artist_name, dataset)
+
+    return all_matches
+
+
+def match_artists(artist_names, try_others=False, dataset=None):
+    """Check artists' top tracks against the unclaimed works dataset
+
+    Returns True when the analysis ran, whether or not anything matched.
+    """
+    try:
+        # Step 1: Load dataset
+        isrc_lookup, _ = load_dataset_correctly(dataset)
+        if isrc_lookup is None:
+            print("❌ Cannot proceed without dataset")
+            return False
+
+        # Step 2: Spotify authentication
+        token = test_spotify_auth()
+        if not token:
+            print("❌ Cannot proceed without Spotify access")
+            return False
+
+        found_any = False
+        for artist_name in artist_names:
+            print(f"\n" + "="*50)
+            print(f"🎵 ANALYZING {artist_name.upper()}")
+            print("="*50)
+
+            artist, artist_catalog, matches = analyze_artist(token, isrc_lookup, artist_name)
+            if matches is None:
+                continue
+
+            create_final_report(artist_catalog, matches, artist['name'], dataset)
+
+            print(f"\n🎉 ANALYSIS COMPLETE!")
+            print("=" * 50)
+            print(f"Artist: {artist['name']}")
+            print(f"Tracks analyzed: {len(artist_catalog)}")
+            print(f"Unclaimed works found: {len(matches)}")
+
+            if not matches.empty:
+                found_any = True
+                print(f"\n🚨 UNCLAIMED WORKS FOUND:")
+                for _, match in matches.iterrows():
+                    print(f"   • '{match['track_name']}'")
+                    print(f"     ISRC: {match['isrc']}")
+                    print()
+            else:
+                print(f"\n✅ No unclaimed works found for {artist['name']}")
+
+        # If no matches found, try other artists
+        if try_others and not found_any:
+            print(f"\n" + "=" * 50)
+            print("NO MATCHES FOUND - TRYING OTHER ARTISTS")
+            print("=" * 50)
+
+            all_matches = try_multiple_artists(token, isrc_lookup, dataset=dataset)
+            if all_matches:
+                print(f"\n🎉 FOUND MATCHES WITH {len(all_matches)} ARTISTS!")
+            else:
+                print(f"\n❌ No matches found with any popular artists")
+                print("💡 The unclaimed works dataset might contain mostly obscure or older works")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ Error in match: {e}")
+        return False
+
+
+def print_artist_summary(tracks_df, artist_df, total_isrcs):
+    """Print the artists with the most unclaimed works"""
+    print("=" * 50)
+    print(f"Tracks found on Spotify: {len(tracks_df)} of {total_isrcs}")
+    if not artist_df.empty:
+        print(f"\n🚨 ARTISTS WITH THE MOST UNCLAIMED WORKS:")
+        for _, artist in artist_df.head(10).iterrows():
+            print(f"   • {artist['artist_name']}: {artist['unclaimed_isrcs']} ISRCs, "
+                  f"{artist['unclaimed_rows']} unclaimed rows")
+
+
+def reverse_resolve(limit=None, max_workers=16, cache_path=None, output_file="reverse_isrc_analysis.xlsx",
+                    dataset=None):
+    """Resolve unclaimed ISRCs back to their Spotify tracks and artists
+
+    Returns True when the lookups ran and the report was saved.
+    """
+    try:
+        isrc_counts = load_unclaimed_isrcs(limit, path=dataset)
+        if not isrc_counts:
+            print("❌ Cannot proceed without dataset")
+            return False
+
+        token = test_spotify_auth()
+        if not token:
+            print("❌ Cannot proceed without Spotify access")
+            return False
+
+        resolved = resolve_isrcs(token, list(isrc_counts), cache_path=cache_path, max_workers=max_workers)
+        if resolved is None:
+            print("❌ Cannot proceed without Spotify access")
+            return False
+        tracks_df, artist_df = summarize_resolved_isrcs(isrc_counts, resolved)
+        saved = create_reverse_report(tracks_df, artist_df, len(isrc_counts), output_file)
+
+        print(f"\n🎉 REVERSE RESOLUTION COMPLETE!")
+        print_artist_summary(tracks_df, artist_df, len(isrc_counts))
+        return saved
+
+    except Exception as e:
+        print(f"❌ Error in reverse resolution: {e}")
+        return False
+
+
+def rebuild_reverse_report(limit=None, cache_path=None, output_file="reverse_isrc_analysis.xlsx", dataset=None):
+    """Rebuild the reverse resolution report from cached lookups, without calling Spotify
+
+    Returns True when the report was saved.
+    """
+    try:
+        isrc_counts = load_unclaimed_isrcs(limit, path=dataset)
+        if not isrc_counts:
+            print("❌ Cannot proceed without dataset")
+            return False
+
+        cache = load_isrc_cache(cache_path)
+        resolved = {isrc: cache[isrc] for isrc in isrc_counts if isrc in cache}
+        tracks_df, artist_df = summarize_resolved_isrcs(isrc_counts, resolved)
+        saved = create_reverse_report(tracks_df, artist_df, len(resolved), output_file)
+
+        print(f"\n🎉 REPORT COMPLETE!")
+        print_artist_summary(tracks_df, artist_df, len(resolved))
+        return saved
+
+    except Exception as e:
+        print(f"❌ Error building report: {e}")
+        return False
@@ -0,0 +1,111 @@
+"""Command line interface: music-rights {index,match,batch,report}
+
+Each subcommand imports only what it needs, so cheap commands such as an
+index lookup never load pandas or requests.
+"""
+
+import argparse
+import warnings
+
+from music_rights import config
+
+
+def run_index(args):
+    """Look ISRCs up in the unclaimed works dataset"""
+    from music_rights.dataset import lookup_isrcs
+
+    found = lookup_isrcs(args.isrcs, args.dataset)
+    if found is None:
+        return 1
+
+    for isrc in args.isrcs:
+        works = found.get(isrc.strip().upper(), [])
+        if works:
+            print(f"🚨 {isrc}: {len(works)} unclaimed work(s)")
+            for work in works:
+                print(f"   • '{work['work_title']}' by {work['writers']}")
+        else:
+            print(f"✅ {isrc}: not in unclaimed works")
+    return 0
+
+
+def run_match(args):
+    """Match artists' top tracks against the unclaimed works"""
+    from music_rights.analysis import match_artists
+
+    ok = match_artists(args.artists, try_others=args.try_others, dataset=args.dataset)
+    return 0 if ok else 1
+
+
+def run_batch(args):
+    """Resolve unclaimed ISRCs through Spotify search"""
+    from music_rights.analysis import reverse_resolve
+
+    ok = reverse_resolve(args.limit, args.workers, args.cache, args.output, dataset=args.dataset)
+    return 0 if ok else 1
+
+
+def run_report(args):
+    """Rebuild the reverse resolution report from the lookup cache"""
+    from music_rights.analysis import rebuild_reverse_report
+
+    ok = rebuild_reverse_report(args.limit, args.cache, args.output, dataset=args.dataset)
+    return 0 if ok else 1
+
+
+def build_parser():
+    """Build the argument parser for all subcommands"""
+    # --dataset is accepted both before and after the subcommand name
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--dataset', default=argparse.SUPPRESS,
+                        help=f"unclaimed works TSV (default: {config.DATASET_FILE})")
+
+    parser = argparse.ArgumentParser(prog="music-rights", description="Music Rights Analysis Tool",
+                                     parents=[common])
+    parser.set_defaults(dataset=None)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    index = subparsers.add_parser('index', parents=[common], help="look ISRCs up in the unclaimed works dataset")
+    index.add_argument('isrcs', nargs='+', metavar='ISRC')
+    index.set_defaults(handler=run_index)
+
+    match = subparsers.add_parser('match', parents=[common], help="check artists' top tracks for unclaimed works")
+    match.add_argument('artists', nargs='*', metavar='ARTIST', default=["The Weeknd"])
+    match.add_argument('--try-others', action='store_true',
+                       help="try popular artists if no matches are found")
+    match.set_defaults(handler=run_match)
+
+    batch = subparsers.add_parser('batch', parents=[common], help="resolve unclaimed ISRCs through Spotify search")
+    batch.add_argument('--limit', type=int, default=None,
+                       help="only resolve the N most frequent unclaimed ISRCs")
+    batch.add_argument('--workers', type=int, default=16,
+                       help="maximum concurrent Spotify requests")
+    batch.add_argument('--cache', default=None,
+                       help=f"lookup cache and checkpoint file (default: {config.ISRC_CACHE_FILE})")
+    batch.add_argument('--output', default="reverse_isrc_analysis.xlsx")
+    batch.set_defaults(handler=run_batch)
+
+    report = subparsers.add_parser('report', parents=[common], help="rebuild the batch report from cached lookups")
+    report.add_argument('--limit', type=int, default=None,
+                        help="only report the N most frequent unclaimed ISRCs")
+    report.add_argument('--cache', default=None,
+                        help=f"lookup cache file (default: {config.ISRC_CACHE_FILE})")
+    report.add_argument('--output', default="reverse_isrc_analysis.xlsx")
+    report.set_defaults(handler=run_report)
+
+    return parser
+
+
+def main(argv=None):
+    """Entry point for the music-rights command"""
+    args = build_parser().parse_args(argv)
+
+    print("🎵 Music Rights Analysis Tool - Final Version")
+    print("=" * 50)
+
+    # pandas and openpyxl warnings are noise for CLI users, but only silence them here
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        # Except the ones naming dataset rows skipped as malformed
+        warnings.filterwarnings('default', message='Skipping line')
+        return args.handler(args)
@@ -0,0 +1,13 @@
+"""Settings shared across the tool, overridable through the environment"""
+
+import os
+
+# Overridable so the tool can be pointed at a local mock of the Spotify API
+SPOTIFY_AUTH_URL = os.environ.get('SPOTIFY_AUTH_URL', "https://accounts.spotify.com/api/token")
+SPOTIFY_API_URL = os.environ.get('SPOTIFY_API_URL', "https://api.spotify.com/v1")
+
+CLIENT_ID = os.environ.get('SPOTIFY_CLIENT_ID', "add your own client key")
+CLIENT_SECRET = os.environ.get('SPOTIFY_CLIENT_SECRET', "add youre own secret key")
+
+DATASET_FILE = os.environ.get('UNCLAIMED_DATASET', 'unclaimedmusicalworkrightshares.tsv')
+ISRC_CACHE_FILE = 'isrc_resolution_cache.jsonl'
@@ -0,0 +1,162 @@
+"""Loading the unclaimed musical work right shares dataset"""
+
+import csv
+from collections import Counter, defaultdict
+
+from music_rights import config
+
+
+def read_dataset_headers(path=None):
+    """Read the column names from the header line that starts with #"""
+    with open(path or config.DATASET_FILE, 'r', encoding='utf-8') as f:
+        header_line = f.readline().strip()
+    if header_line.startswith('#'):
+        header_line = header_line[1:]  # Remove the # character
+    return header_line.split('\t')
+
+
+def unclaimed_work(title, writers):
+    """Build the record stored for each unclaimed ISRC"""
+    return {
+        'work_title': str(title),
+        'writers': str(writers),
+        'publishers': 'Unknown',
+        'status': 'Unclaimed'
+    }
+
+
+def load_dataset_correctly(path=None):
+    """Load the dataset with correct header handling"""
+    import pandas as pd
+
+    path = path or config.DATASET_FILE
+    print("📊 Step 1: Loading dataset with correct headers...")
+
+    try:
+        actual_headers = read_dataset_headers(path)
+        print(f"✅ Actual headers: {actual_headers}")
+
+        # Now read the data with the correct headers
+        df = pd.read_csv(path,
+                         sep='\t',
+                         encoding='utf-8',
+                         comment='#',
+                         nrows=50000,
+                         header=0,
+                         names=actual_headers)
+
+        print("✅ Successfully loaded dataset with proper headers")
+        print(f"📊 Dataset shape: {df.shape}")
+        print(f"📋 Dataset columns: {list(df.columns)}")
+
+        # Create ISRC lookup
+        isrc_lookup = defaultdict(list)
+        isrc_column = 'ISRC'
+
+        if isrc_column not in df.columns:
+            print("❌ ISRC column not found!")
+            return None, df
+
+        print(f"✅ Using ISRC column: '{isrc_column}'")
+
+        # Build the lookup dictionary
+        valid_isrcs = 0
+        for idx, row in df.iterrows():
+            isrc_code = str(row[isrc_column]).strip().upper()
+            if isrc_code and isrc_code != 'NAN' and len(isrc_code) >= 10:
+                isrc_lookup[isrc_code].append(unclaimed_work(
+                    row.get('ResourceTitle', 'Unknown'),
+                    row.get('DisplayArtistName', 'Unknown')))
+                valid_isrcs += 1
+
+        print(f"✅ Built lookup with {valid_isrcs} valid ISRC codes")
+        print(f"🔍 Sample ISRCs: {list(isrc_lookup.keys())[:5]}")
+
+        return isrc_lookup, df
+
+    except Exception as e:
+        print(f"❌ Error loading dataset: {e}")
+        return None, None
+
+
+def lookup_isrcs(isrcs, path=None):
+    """Find the unclaimed works for a few ISRCs by scanning the dataset
+
+    Uses only the standard library so a lookup does not pay for importing pandas.
+    """
+    try:
+        wanted = {isrc.strip().upper() for isrc in isrcs}
+        path = path or config.DATASET_FILE
+
+        headers = read_dataset_headers(path)
+        if 'ISRC' not in headers:
+            print("❌ ISRC column not found!")
+            return None
+
+        isrc_index = headers.index('ISRC')
+        title_index = headers.index('ResourceTitle') if 'ResourceTitle' in headers else None
+        artist_index = headers.index('DisplayArtistName') if 'DisplayArtistName' in headers else None
+
+        found = defaultdict(list)
+        with open(path, 'r', encoding='utf-8') as f:
+            next(f)  # Header line
+            for line in f:
+                fields = line.rstrip('\r\n').split('\t')
+                if len(fields) <= isrc_index:
+                    continue
+                isrc_code = fields[isrc_index].strip().upper()
+                if isrc_code in wanted:
+                    found[isrc_code].append(unclaimed_work(
+                        fields[title_index] if title_index is not None and title_index < len(fields) else 'Unknown',
+                        fields[artist_index] if artist_index is not None and artist_index < len(fields) else 'Unknown'))
+
+        return found
+
+    except Exception as e:
+        print(f"❌ Error reading dataset: {e}")
+        return None
+
+
+def load_unclaimed_isrcs(limit=None, chunksize=200000, path=None):
+    """Read every ISRC from the unclaimed dataset, de-duplicated and ranked by row count"""
+    import pandas as pd
+
+    path = path or config.DATASET_FILE
+    print("📊 Loading unclaimed ISRCs for reverse resolution...")
+
+    try:
+        actual_headers = read_dataset_headers(path)
+        if 'ISRC' not in actual_headers:
+            print("❌ ISRC column not found!")
+            return None
+
+        # Only the ISRC column is parsed, in chunks, so the full file can be scanned.
+        # The header line is skipped rather than using comment='#', which would cut
+        # off any row whose title contains a '#'. Quotes are not special either, so
+        # a stray '"' in a title cannot swallow the rows after it, matching how
+        # lookup_isrcs splits lines. Rows with too many fields are skipped with a warning.
+        isrc_counts = Counter()
+        chunks = pd.read_csv(path,
+                             sep='\t',
+                             encoding='utf-8',
+                             skiprows=1,
+                             header=None,
+                             names=actual_headers,
+                             usecols=['ISRC'],
+                             dtype=str,
+                             quoting=csv.QUOTE_NONE,
+                             on_bad_lines='warn',
+                             chunksize=chunksize)
+        for chunk in chunks:
+            codes = chunk['ISRC'].dropna().str.strip().str.upper()
+            codes = codes[(codes.str.len() >= 10) & ~codes.str.startswith('#')]
+            isrc_counts.update(codes.value_counts().to_dict())
+
+        # Biggest unclaimed works first, so partial runs cover what matters most
+        ranked = isrc_counts.most_common(limit)
+        print(f"✅ Found {len(isrc_counts)} unique ISRCs, using {len(ranked)}")
+        return dict(ranked)
+
+    except Exception as e:
+        print(f"❌ Error loading ISRCs: {e}")
+        return None
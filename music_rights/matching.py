@@ -0,0 +1,45 @@
+"""Matching Spotify tracks against unclaimed works"""
+
+
+def find_matches(artist_catalog, isrc_lookup):
+    """Find matches between artist catalog and unclaimed works"""
+    import pandas as pd
+
+    print(f"\n🔍 Step 4: Finding matches...")
+
+    matches = []
+    for _, track in artist_catalog.iterrows():
+        isrc_code = str(track['isrc']).strip().upper()
+        if isrc_code in isrc_lookup:
+            for unclaimed_work in isrc_lookup[isrc_code]:
+                match = track.to_dict()
+                match.update(unclaimed_work)
+                matches.append(match)
+
+    result_df = pd.DataFrame(matches) if matches else pd.DataFrame()
+    print(f"✅ Found {len(result_df)} matches in unclaimed works")
+    return result_df
+
+
+def summarize_resolved_isrcs(isrc_counts, resolved):
+    """Join resolved tracks with unclaimed row counts and rank artists"""
+    import pandas as pd
+
+    rows = []
+    for isrc, track in resolved.items():
+        if track:
+            row = {'isrc': isrc, 'unclaimed_rows': isrc_counts.get(isrc, 0)}
+            row.update(track)
+            rows.append(row)
+
+    tracks_df = pd.DataFrame(rows)
+    if tracks_df.empty:
+        return tracks_df, pd.DataFrame()
+
+    tracks_df = tracks_df.sort_values('unclaimed_rows', ascending=False)
+    artist_df = (tracks_df.groupby(['artist_id', 'artist_name'], as_index=False)
+                 .agg(unclaimed_isrcs=('isrc', 'count'),
+                      unclaimed_rows=('unclaimed_rows', 'sum'),
+                      max_popularity=('popularity', 'max'))
+                 .sort_values('unclaimed_rows', ascending=False))
+    return tracks_df, artist_df
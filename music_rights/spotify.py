@@ -0,0 +1,331 @@
+"""Spotify Web API access: authentication, artist catalogues and ISRC search"""
+
+import base64
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from itertools import islice
+
+from music_rights import config
+
+
+def test_spotify_auth():
+    """Test Spotify authentication"""
+    import requests
+
+    print("\n🔐 Step 2: Testing Spotify authentication...")
+
+    try:
+        # Encode credentials
+        client_creds = f"{config.CLIENT_ID}:{config.CLIENT_SECRET}"
+        client_creds_b64 = base64.b64encode(client_creds.encode()).decode()
+
+        headers = {
+            'Authorization': f'Basic {client_creds_b64}',
+            'Content-Type': 'application/x-www-form-urlencoded'
+        }
+
+        data = {'grant_type': 'client_credentials'}
+
+        response = requests.post(
+            config.SPOTIFY_AUTH_URL,
+            headers=headers,
+            data=data,
+            timeout=10
+        )
+
+        if response.status_code == 200:
+            token_data = response.json()
+            print("✅ Spotify authentication successful!")
+            return token_data['access_token']
+        else:
+            print(f"❌ Spotify auth failed: {response.status_code}")
+            return None
+
+    except Exception as e:
+        print(f"❌ Error during Spotify auth: {e}")
+        return None
+
+
+def get_artist_discography(token, artist_id, artist_name):
+    """Get a few tracks from an artist"""
+    import pandas as pd
+    import requests
+
+    print(f"\n🎵 Step 3: Getting {artist_name}'s popular tracks...")
+
+    try:
+        headers = {'Authorization': f'Bearer {token}'}
+
+        # Get artist's top tracks
+        url = f"{config.SPOTIFY_API_URL}/artists/{artist_id}/top-tracks?market=US"
+        response = requests.get(url, headers=headers, timeout=10)
+
+        if response.status_code == 200:
+            tracks_data = response.json().get('tracks', [])
+            catalog = []
+
+            for track in tracks_data[:10]:  # Get top 10 tracks
+                external_ids = track.get('external_ids', {})
+                isrc = external_ids.get('isrc', '')
+
+                if isrc:
+                    catalog.append({
+                        'track_name': track.get('name', ''),
+                        'album_name': track.get('album', {}).get('name', ''),
+                        'release_date': track.get('album', {}).get('release_date', ''),
+                        'isrc': isrc,
+                        'popularity': track.get('popularity', 0),
+                    })
+
+            df = pd.DataFrame(catalog)
+            print(f"✅ Retrieved {len(df)} tracks with ISRC codes")
+            print(f"📋 Sample tracks:")
+            for i, track in df.head(3).iterrows():
+                print(f"   • {track['track_name']} (ISRC: {track['isrc']})")
+            return df
+        else:
+            print(f"❌ Error getting top tracks: {response.status_code}")
+            return pd.DataFrame()
+
+    except Exception as e:
+        print(f"❌ Error getting discography: {e}")
+        return pd.DataFrame()
+
+
+def search_artist(token, artist_name="The Weeknd"):
+    """Search for artist"""
+    import requests
+
+    print(f"\n🔍 Searching for artist '{artist_name}'...")
+
+    try:
+        headers = {'Authorization': f'Bearer {token}'}
+        params = {
+            'q': artist_name,
+            'type': 'artist',
+            'limit': 5
+        }
+
+        response = requests.get(
+            f"{config.SPOTIFY_API_URL}/search",
+            headers=headers,
+            params=params,
+            timeout=10
+        )
+
+        if response.status_code == 200:
+            artists = response.json().get('artists', {}).get('items', [])
+            if artists:
+                print(f"✅ Found {len(artists)} artists:")
+                for artist in artists:
+                    print(f"   • {artist['name']} (Popularity: {artist['popularity']})")
+                return artists[0]  # Return most popular
+            else:
+                print("❌ No artists found")
+                return None
+        else:
+            print(f"❌ Search failed: {response.status_code}")
+            return None
+
+    except Exception as e:
+        print(f"❌ Error searching artist: {e}")
+        return None
+
+
+def load_isrc_cache(cache_path=None):
+    """Load previously resolved ISRCs from the JSON-lines cache"""
+    cache_path = cache_path or config.ISRC_CACHE_FILE
+    cache = {}
+    if not os.path.exists(cache_path):
+        return cache
+
+    with open(cache_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue  # Partially written line from an interrupted run
+            cache[entry['isrc']] = entry['track']
+
+    print(f"✅ Loaded {len(cache)} cached ISRC lookups from {cache_path}")
+    return cache
+
+
+def parse_isrc_track(track):
+    """Flatten a Spotify track object into the columns used in reports"""
+    album = track.get('album', {})
+    artists = track.get('artists', [])
+    return {
+        'track_name': track.get('name', ''),
+        'artist_name': artists[0].get('name', '') if artists else '',
+        'artist_id': artists[0].get('id', '') if artists else '',
+        'all_artists': ', '.join(a.get('name', '') for a in artists),
+        'album_name': album.get('name', ''),
+        'release_date': album.get('release_date', ''),
+        'popularity': track.get('popularity', 0),
+        'spotify_id': track.get('id', ''),
+    }
+
+
+def search_isrc(session, auth, isrc, max_attempts=5, max_throttles=100):
+    """Look up a single ISRC with Spotify's isrc: search query
+
+    Returns (resolved, track) where track is None when Spotify has no match.
+    resolved is False when the lookup failed and should be retried next run.
+    Rate-limited responses pause every worker and do not use up an attempt.
+    """
+    import requests
+
+    params = {'q': f'isrc:{isrc}', 'type': 'track', 'limit': 1}
+
+    attempt = throttles = 0
+    while attempt < max_attempts and throttles < max_throttles:
+        if auth['failed']:
+            return False, None
+        wait_for_rate_limit(auth)
+        token = auth['token']
+        try:
+            response = session.get(
+                f"{config.SPOTIFY_API_URL}/search",
+                headers={'Authorization': f'Bearer {token}'},
+                params=params,
+                timeout=10
+            )
+        except requests.RequestException:
+            time.sleep(2 ** attempt * 0.5)
+            attempt += 1
+            continue
+
+        if response.status_code == 200:
+            try:
+                items = response.json().get('tracks', {}).get('items', [])
+            except ValueError:
+                # Not JSON, e.g. an HTML page from a proxy; treat as transient
+                time.sleep(2 ** attempt * 0.5)
+                attempt += 1
+                continue
+            return True, parse_isrc_track(items[0]) if items else None
+        elif response.status_code == 429:
+            try:
+                retry_after = float(response.headers.get('Retry-After', 1))
+            except ValueError:
+                retry_after = 1
+            rate_limited(auth, retry_after)
+            throttles += 1
+        elif response.status_code == 401:
+            refresh_token(auth, token)
+            attempt += 1
+        elif response.status_code >= 500:
+            time.sleep(2 ** attempt * 0.5)
+            attempt += 1
+        else:
+            return False, None
+
+    return False, None
+
+
+def rate_limited(auth, retry_after):
+    """Hold back every worker until Spotify's Retry-After has passed"""
+    with auth['lock']:
+        auth['not_before'] = max(auth['not_before'], time.time() + retry_after)
+
+
+def wait_for_rate_limit(auth):
+    """Sleep until the shared rate limit pause is over"""
+    while True:
+        with auth['lock']:
+            delay = auth['not_before'] - time.time()
+        if delay <= 0:
+            return
+        time.sleep(delay)
+
+
+def refresh_token(auth, expired_token):
+    """Fetch a new access token once, however many workers saw it expire
+
+    If the refresh fails, auth['failed'] is set so every worker stops instead
+    of asking for a new token on each lookup.
+    """
+    with auth['lock']:
+        if auth['token'] == expired_token and not auth['failed']:
+            new_token = test_spotify_auth()
+            if new_token:
+                auth['token'] = new_token
+            else:
+                auth['failed'] = True
+
+
+def resolve_isrcs(token, isrcs, cache_path=None, max_workers=16, checkpoint_every=1000):
+    """Resolve ISRCs concurrently, checkpointing results to the cache file
+
+    Returns None if the Spotify token expired and could not be refreshed;
+    lookups finished before that are still saved to the cache.
+    """
+    import requests
+
+    cache_path = cache_path or config.ISRC_CACHE_FILE
+    print(f"\n🔍 Resolving ISRCs through Spotify search ({max_workers} workers)...")
+
+    cache = load_isrc_cache(cache_path)
+    todo = [isrc for isrc in isrcs if isrc not in cache]
+    print(f"📋 {len(isrcs) - len(todo)} already cached, {len(todo)} to look up")
+
+    auth = {'token': token, 'failed': False, 'not_before': 0.0, 'lock': threading.Lock()}
+    local = threading.local()
+
+    def lookup(isrc):
+        if not hasattr(local, 'session'):
+            local.session = requests.Session()
+        return isrc, search_isrc(local.session, auth, isrc)
+
+    resolved = failed = 0
+    pending_lines = []
+    started = time.time()
+
+    def checkpoint(cache_file):
+        cache_file.write(''.join(pending_lines))
+        cache_file.flush()
+        pending_lines.clear()
+
+    # Start on a fresh line if an interrupted run left a partial record behind
+    if os.path.exists(cache_path) and os.path.getsize(cache_path):
+        with open(cache_path, 'rb+') as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b'\n':
+                f.write(b'\n')
+
+    with open(cache_path, 'a', encoding='utf-8') as cache_file, \
+            ThreadPoolExecutor(max_workers=max_workers) as executor:
+        queue = iter(todo)
+        # Keep a bounded window of requests in flight rather than one future per ISRC
+        in_flight = {executor.submit(lookup, isrc) for isrc in islice(queue, max_workers * 4)}
+        try:
+            while in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    isrc, (ok, track) = future.result()
+                    if ok:
+                        cache[isrc] = track
+                        pending_lines.append(json.dumps({'isrc': isrc, 'track': track}) + '\n')
+                        resolved += 1
+                    else:
+                        failed += 1
+                if not auth['failed']:
+                    in_flight.update(executor.submit(lookup, isrc) for isrc in islice(queue, len(done)))
+
+                if len(pending_lines) >= checkpoint_every:
+                    checkpoint(cache_file)
+                    rate = resolved / max(time.time() - started, 1e-6)
+                    print(f"💾 Checkpoint: {resolved + failed}/{len(todo)} looked up ({rate:.0f}/s)")
+        finally:
+            checkpoint(cache_file)
+
+    if auth['failed']:
+        print(f"❌ Spotify token refresh failed, stopped after resolving {resolved} ISRCs")
+        return None
+
+    print(f"✅ Resolved {resolved} ISRCs ({failed} failed, will retry next run)")
+    return {isrc: cache[isrc] for isrc in isrcs if isrc in cache}
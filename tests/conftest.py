@@ -0,0 +1,12 @@
+import pytest
+
+from music_rights import config
+from tests.mock_spotify import MockSpotify
+
+
+@pytest.fixture
+def mock(monkeypatch):
+    with MockSpotify() as mock:
+        monkeypatch.setattr(config, 'SPOTIFY_API_URL', f"{mock.url}/v1")
+        monkeypatch.setattr(config, 'SPOTIFY_AUTH_URL', f"{mock.url}/token")
+        yield mock
@@ -0,0 +1,168 @@
+"""A local mock of the Spotify endpoints used by the match and batch subcommands
+
+Run directly for a load test against the reverse resolution code:
+
+    python tests/mock_spotify.py --isrcs 200000 --workers 32
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlparse
+
+
+class MockSpotify:
+    """Serves /token, /v1/search and /v1/artists/<id>/top-tracks from a background thread
+
+    top_tracks maps an artist name to the ISRCs of its top tracks.
+
+    scripted maps an ISRC to a list of responses served before the real one:
+    an HTTP status code, 'html' for a 200 whose body is not JSON, or
+    (429, seconds) for a rate limit with that Retry-After.
+    """
+
+    def __init__(self):
+        self.token_count = 0
+        self.auth_requests = 0
+        self.auth_fails = False
+        self.valid_token = None
+        self.scripted = defaultdict(list)
+        self.top_tracks = {}
+        self.searches = Counter()
+        self.search_times = []
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def issue_token(self):
+        with self.lock:
+            self.token_count += 1
+            self.valid_token = f"token-{self.token_count}"
+            return self.valid_token
+
+    def expire_token(self):
+        with self.lock:
+            self.valid_token = None
+
+    @staticmethod
+    def track_for(isrc):
+        """ISRCs ending in 0 have no Spotify match, the rest get a track"""
+        if isrc.endswith('0'):
+            return None
+        artist = int(isrc[-3:]) % 7 if isrc[-3:].isdigit() else 0
+        return {
+            'id': f"t{isrc}",
+            'name': f"Song {isrc}",
+            'popularity': 50,
+            'artists': [{'id': f"a{artist}", 'name': f"Artist {artist}"}],
+            'album': {'name': 'Album', 'release_date': '2020-01-01'},
+        }
+
+    def _handler(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def send(self, status, body, headers=()):
+                data = body if isinstance(body, bytes) else json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header('Content-Length', str(len(data)))
+                for name, value in headers:
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                with mock.lock:
+                    mock.auth_requests += 1
+                if mock.auth_fails:
+                    return self.send(400, {'error': 'invalid_client'})
+                self.send(200, {'access_token': mock.issue_token()})
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                query = parse_qs(url.query)
+                if url.path.endswith('/top-tracks'):
+                    return self.send_top_tracks(unquote(url.path.split('/')[-2]))
+                if query.get('type') == ['artist']:
+                    return self.send_artist(query['q'][0])
+
+                isrc = query['q'][0].split(':', 1)[1]
+                with mock.lock:
+                    mock.searches[isrc] += 1
+                    mock.search_times.append(time.time())
+                    scripted = mock.scripted[isrc].pop(0) if mock.scripted[isrc] else None
+                    valid_token = mock.valid_token
+
+                if self.headers.get('Authorization') != f"Bearer {valid_token}":
+                    return self.send(401, {'error': 'token expired'})
+                if scripted == 'html':
+                    return self.send(200, b"<html>Bad Gateway</html>")
+                if scripted == 429:
+                    return self.send(429, {}, [('Retry-After', '0')])
+                if isinstance(scripted, tuple):
+                    return self.send(429, {}, [('Retry-After', str(scripted[1]))])
+                if scripted is not None:
+                    return self.send(scripted, {})
+
+                track = mock.track_for(isrc)
+                self.send(200, {'tracks': {'items': [track] if track else []}})
+
+            def send_artist(self, name):
+                items = [{'id': name, 'name': name, 'popularity': 80}] if name in mock.top_tracks else []
+                self.send(200, {'artists': {'items': items}})
+
+            def send_top_tracks(self, artist_id):
+                tracks = [{'name': f"Song {isrc}", 'popularity': 50, 'external_ids': {'isrc': isrc},
+                           'album': {'name': 'Album', 'release_date': '2020-01-01'}}
+                          for isrc in mock.top_tracks.get(artist_id, [])]
+                self.send(200, {'tracks': tracks})
+
+        return Handler
+
+
+def load_test(count, workers):
+    """Resolve count ISRCs against the mock and report the throughput"""
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from music_rights import config
+    from music_rights.spotify import resolve_isrcs
+
+    isrcs = [f"USMOC{i:07d}" for i in range(count)]
+    with MockSpotify() as mock, tempfile.TemporaryDirectory() as tmp:
+        config.SPOTIFY_API_URL = f"{mock.url}/v1"
+        config.SPOTIFY_AUTH_URL = f"{mock.url}/token"
+        cache_path = os.path.join(tmp, 'cache.jsonl')
+
+        started = time.time()
+        resolved = resolve_isrcs(mock.issue_token(), isrcs, cache_path=cache_path,
+                                 max_workers=workers, checkpoint_every=10000)
+        elapsed = time.time() - started
+        print(f"\n{len(resolved)}/{count} ISRCs in {elapsed:.1f}s ({count / elapsed:.0f}/s)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test batch resolution against a mock Spotify")
+    parser.add_argument('--isrcs', type=int, default=200000)
+    parser.add_argument('--workers', type=int, default=32)
+    args = parser.parse_args()
+    load_test(args.isrcs, args.workers)
@@ -0,0 +1,75 @@
+from music_rights import config
+from music_rights.cli import main
+
+DATASET = "#ISRC\tResourceTitle\tDisplayArtistName\nUSMOC0000001\tFirst Song\tWriter\n"
+
+
+def test_index_finds_isrc_in_given_dataset(tmp_path, capsys):
+    dataset = tmp_path / 'works.tsv'
+    dataset.write_text(DATASET, encoding='utf-8')
+
+    assert main(['index', 'usmoc0000001', '--dataset', str(dataset)]) == 0
+    assert "'First Song' by Writer" in capsys.readouterr().out
+
+
+def test_dataset_option_does_not_change_config(tmp_path):
+    default = config.DATASET_FILE
+    dataset = tmp_path / 'works.tsv'
+    dataset.write_text(DATASET, encoding='utf-8')
+
+    main(['--dataset', str(dataset), 'index', 'USMOC0000001'])
+
+    assert config.DATASET_FILE == default
+
+
+def test_commands_exit_non_zero_when_dataset_is_missing(tmp_path):
+    missing = str(tmp_path / 'missing.tsv')
+
+    assert main(['index', 'USMOC0000001', '--dataset', missing]) == 1
+    assert main(['batch', '--dataset', missing, '--cache', str(tmp_path / 'cache.jsonl')]) == 1
+    assert main(['report', '--dataset', missing, '--cache', str(tmp_path / 'cache.jsonl')]) == 1
+    assert main(['--dataset', missing, 'match']) == 1
+
+
+def test_batch_and_report_write_to_output(mock, tmp_path):
+    dataset = tmp_path / 'works.tsv'
+    dataset.write_text(DATASET, encoding='utf-8')
+    cache = str(tmp_path / 'cache.jsonl')
+
+    common = ['--dataset', str(dataset), '--cache', cache]
+    assert main(['batch', *common, '--output', str(tmp_path / 'batch.xlsx')]) == 0
+    assert main(['report', *common, '--output', str(tmp_path / 'report.xlsx')]) == 0
+    assert (tmp_path / 'batch.xlsx').exists()
+    assert (tmp_path / 'report.xlsx').exists()
+
+
+def test_match_report_names_the_given_dataset(mock, tmp_path, monkeypatch, capsys):
+    import pandas as pd
+
+    # load_dataset_correctly treats the first data row as a header
+    dataset = tmp_path / 'works.tsv'
+    dataset.write_text(DATASET + "USMOC0000002\tSecond Song\tWriter\n", encoding='utf-8')
+    mock.top_tracks['Matched'] = ['USMOC0000002', 'USMOC0000003']
+    monkeypatch.chdir(tmp_path)
+
+    assert main(['match', 'Matched', '--dataset', str(dataset)]) == 0
+    assert "Tracks analyzed: 2" in capsys.readouterr().out
+
+    notes = pd.read_excel(tmp_path / 'Matched_analysis.xlsx', sheet_name='Process_Notes')
+    assert f"Dataset: {dataset}" in notes['Details'].iloc[-1]
+
+
+def test_try_others_only_reports_fallback_artists_with_matches(mock, tmp_path, monkeypatch):
+    from music_rights.analysis import FALLBACK_ARTISTS
+
+    dataset = tmp_path / 'works.tsv'
+    dataset.write_text(DATASET + "USMOC0000002\tSecond Song\tWriter\n", encoding='utf-8')
+    mock.top_tracks['Unmatched'] = ['USMOC0000009']
+    mock.top_tracks[FALLBACK_ARTISTS[0]] = ['USMOC0000008']
+    mock.top_tracks[FALLBACK_ARTISTS[1]] = ['USMOC0000002']
+    monkeypatch.chdir(tmp_path)
+
+    assert main(['match', 'Unmatched', '--try-others', '--dataset', str(dataset)]) == 0
+
+    reports = sorted(path.name for path in tmp_path.glob('*_analysis.xlsx'))
+    assert reports == ['Ed_Sheeran_analysis.xlsx', 'Unmatched_analysis.xlsx']
@@ -0,0 +1,109 @@
+import json
+import time
+
+import pytest
+
+from music_rights.spotify import resolve_isrcs
+
+ISRCS = [f"USMOC{i:07d}" for i in range(1, 41)]
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / 'cache.jsonl')
+
+
+def read_cache(path):
+    """Parse the cache file, skipping a partial line left by an interrupted run"""
+    cache = {}
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            cache[entry['isrc']] = entry['track']
+    return cache
+
+
+def test_resolves_and_caches_every_isrc(mock, cache_path):
+    resolved = resolve_isrcs(mock.issue_token(), ISRCS, cache_path=cache_path, max_workers=8)
+
+    assert set(resolved) == set(ISRCS)
+    assert resolved['USMOC0000010'] is None
+    assert resolved['USMOC0000011']['track_name'] == "Song USMOC0000011"
+    assert read_cache(cache_path) == resolved
+
+
+def test_resume_only_looks_up_missing_isrcs(mock, cache_path):
+    resolve_isrcs(mock.issue_token(), ISRCS[:30], cache_path=cache_path, max_workers=8)
+    # Simulate a run killed mid-write
+    with open(cache_path, 'a', encoding='utf-8') as f:
+        f.write('{"isrc": "USMOC00000')
+    mock.searches.clear()
+
+    resolved = resolve_isrcs(mock.valid_token, ISRCS, cache_path=cache_path, max_workers=8)
+
+    assert set(mock.searches) == set(ISRCS[30:])
+    assert set(resolved) == set(ISRCS)
+    assert set(read_cache(cache_path)) == set(ISRCS)
+
+
+def test_retries_rate_limits_server_errors_and_bad_bodies(mock, cache_path):
+    mock.scripted['USMOC0000001'] = [429] * 6  # More than max_attempts
+    mock.scripted['USMOC0000002'] = [503]
+    mock.scripted['USMOC0000003'] = ['html']
+
+    resolved = resolve_isrcs(mock.issue_token(), ISRCS[:5], cache_path=cache_path, max_workers=4)
+
+    assert mock.searches['USMOC0000001'] == 7
+    assert mock.searches['USMOC0000002'] == 2
+    assert mock.searches['USMOC0000003'] == 2
+    assert all(resolved[isrc] for isrc in ISRCS[:5])
+
+
+def test_rate_limit_pauses_every_worker(mock, cache_path):
+    isrcs = [f"USMOC{i:07d}" for i in range(1, 201)]
+    mock.scripted['USMOC0000001'] = [(429, 1)]
+
+    started = time.time()
+    resolved = resolve_isrcs(mock.issue_token(), isrcs, cache_path=cache_path, max_workers=8)
+
+    assert set(resolved) == set(isrcs)
+    assert time.time() - started >= 1
+    # Only requests already in flight when the 429 arrived may land during the pause
+    during_pause = [t for t in mock.search_times if started + 0.3 < t < started + 0.9]
+    assert during_pause == []
+
+
+def test_refreshes_expired_token_once(mock, cache_path):
+    token = mock.issue_token()
+    mock.expire_token()
+
+    resolved = resolve_isrcs(token, ISRCS, cache_path=cache_path, max_workers=8)
+
+    assert set(resolved) == set(ISRCS)
+    assert mock.token_count == 2
+
+
+def test_stops_when_token_refresh_fails(mock, cache_path):
+    isrcs = [f"USMOC{i:07d}" for i in range(1, 201)]
+    token = mock.issue_token()
+    mock.expire_token()
+    mock.auth_fails = True
+
+    assert resolve_isrcs(token, isrcs, cache_path=cache_path, max_workers=8) is None
+    assert mock.auth_requests == 1  # One failed refresh, not one per lookup
+    assert sum(mock.searches.values()) <= 8 * 4
+
+
+def test_failed_lookups_are_not_cached(mock, cache_path):
+    mock.scripted['USMOC0000001'] = [400]
+
+    resolved = resolve_isrcs(mock.issue_token(), ISRCS[:3], cache_path=cache_path, max_workers=2)
+
+    assert 'USMOC0000001' not in resolved
+    assert 'USMOC0000001' not in read_cache(cache_path)
+
+    resolved = resolve_isrcs(mock.valid_token, ISRCS[:3], cache_path=cache_path, max_workers=2)
+    assert resolved['USMOC0000001']['track_name'] == "Song USMOC0000001"